@@ -1,13 +1,15 @@
 # main.py
 
+import numpy as np
 from path_generator import generate_cylindrical_path, generate_straight_wall, generate_hollow_cube, generate_convex_circle, generate_concave_circle
 import path_generator
-from path_importer import load_path
-from profile_generator import generate_rectangle_profile, generate_circle_profile
+from path_importer import load_path, load_profile_params
+from profile_generator import generate_rectangle_profile, generate_circle_profile, generate_circle_profiles, generate_rectangle_profiles
 from rmf import compute_rmf_frames, oriented_profiles_rmf
 from mesh_exporter import export_mesh_to_obj
 from mesh_editor import laplacian_smoothing, weld_vertices
 from visualization import plot_oriented_profiles, animate_oriented_profiles
+from rasterizer import render_oriented_profiles, animate_oriented_profiles_headless
 
 def main():
     # ----------------------------
@@ -39,6 +41,13 @@ def main():
     elif prof == 2:
         # Alternatively, create a circular (or elliptical) profile:
         profile = generate_circle_profile(radius=1.0, num_points=12, radius_y=2.0)
+    elif prof == 3:
+        # Variable cross-section: one profile per path point, e.g. bead width/height
+        # varying with flow rate. Parameters can also come from extra CSV columns:
+        #params = load_profile_params('concave_path.csv')
+        #profile = generate_rectangle_profiles(width=params['width'], height=params['height'])
+        radius = np.linspace(0.5, 1.5, len(path))
+        profile = generate_circle_profiles(radius=radius, num_points=12, radius_y=2.0 * radius)
     # ----------------------------
     # Step 3: Compute RMF frames along the path
     # ----------------------------
@@ -62,6 +71,10 @@ def main():
     
     # For animated visualization, comment out the static plot above and uncomment below:
     #animate_oriented_profiles(oriented_profiles, path, interval=300)
+
+    # For headless batch runs (no display, no matplotlib), render a thumbnail or GIF instead:
+    #render_oriented_profiles(oriented_profiles, filename='thumbnail.png', width=256, height=256)
+    #animate_oriented_profiles_headless(oriented_profiles, filename='animation.gif', interval=100)
     
 if __name__ == '__main__':
     main()
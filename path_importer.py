@@ -1,4 +1,5 @@
 import csv
+import numpy as np
 
 
 def load_path(filename):
@@ -7,4 +8,22 @@ def load_path(filename):
         reader = csv.DictReader(csvfile)
         for row in reader:
             points.append((float(row['x']), float(row['y']), float(row['z'])))
-    return points
\ No newline at end of file
+    return points
+
+
+def load_profile_params(filename, columns=('width', 'height', 'radius_y')):
+    """
+    Load per-point profile parameters from extra CSV columns alongside x, y, z.
+
+    Returns a dict mapping each requested column present in the file to a
+    NumPy array aligned with the path returned by load_path(). Missing
+    columns are left out.
+    """
+    with open(filename, 'r') as csvfile:
+        reader = csv.DictReader(csvfile)
+        present = [c for c in columns if c in (reader.fieldnames or [])]
+        params = {c: [] for c in present}
+        for row in reader:
+            for c in present:
+                params[c].append(float(row[c]))
+    return {c: np.array(values) for c, values in params.items()}
@@ -1,14 +1,22 @@
 import numpy as np
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def _circle_trig_table(num_points):
+    """Cached (cos, sin) of num_points evenly spaced angles, with the first angle repeated to close the loop."""
+    angles = np.linspace(0, 2*np.pi, num_points, endpoint=False)
+    cos_table = np.append(np.cos(angles), 1.0)
+    sin_table = np.append(np.sin(angles), 0.0)
+    cos_table.flags.writeable = False
+    sin_table.flags.writeable = False
+    return cos_table, sin_table
 
 def generate_circle_profile(radius=0.5, num_points=12, radius_y=None):
     """Generate a 2D circular (or elliptical) profile in the XY plane, closed."""
     if radius_y is None:
         radius_y = radius  # For a perfect circle, both radii are equal.
-    angles = np.linspace(0, 2*np.pi, num_points, endpoint=False)
-    points = np.array([[radius * np.cos(a), radius_y * np.sin(a)] for a in angles])
-    # Close the loop by appending the first point at the end.
-    points = np.vstack([points, points[0]])
-    return points
+    cos_table, sin_table = _circle_trig_table(num_points)
+    return np.stack([radius * cos_table, radius_y * sin_table], axis=-1)
 
 def generate_rectangle_profile(width=1.0, height=0.5):
     # A closed rectangle profile in the XY plane.
@@ -18,4 +26,45 @@ def generate_rectangle_profile(width=1.0, height=0.5):
         [ width/2,  height/2],
         [-width/2,  height/2],
         [-width/2, -height/2]  # Close the loop
-    ])
\ No newline at end of file
+    ])
+
+def generate_circle_profiles(radius, num_points=12, radius_y=None):
+    """
+    Generate one closed circular (or elliptical) profile per path point.
+
+    Parameters:
+      radius: Scalar or length-P array of radii along the profile x-axis.
+      num_points: Number of points per profile (before closing the loop).
+      radius_y: Scalar or length-P array of radii along the profile y-axis (defaults to radius).
+
+    Returns:
+      A (P, num_points + 1, 2) NumPy array of profiles.
+    """
+    radius = np.atleast_1d(np.asarray(radius, dtype=float))
+    radius_y = radius if radius_y is None else np.atleast_1d(np.asarray(radius_y, dtype=float))
+    radius, radius_y = np.broadcast_arrays(radius, radius_y)
+    cos_table, sin_table = _circle_trig_table(num_points)
+    profiles = np.empty((len(radius), num_points + 1, 2))
+    np.multiply.outer(radius, cos_table, out=profiles[:, :, 0])
+    np.multiply.outer(radius_y, sin_table, out=profiles[:, :, 1])
+    return profiles
+
+def generate_rectangle_profiles(width, height):
+    """
+    Generate one closed rectangle profile per path point.
+
+    Parameters:
+      width: Scalar or length-P array of widths along the profile x-axis.
+      height: Scalar or length-P array of heights along the profile y-axis.
+
+    Returns:
+      A (P, 5, 2) NumPy array of profiles.
+    """
+    width = np.atleast_1d(np.asarray(width, dtype=float))
+    height = np.atleast_1d(np.asarray(height, dtype=float))
+    width, height = np.broadcast_arrays(width, height)
+    unit = generate_rectangle_profile(width=1.0, height=1.0)
+    profiles = np.empty((len(width), len(unit), 2))
+    np.multiply.outer(width, unit[:, 0], out=profiles[:, :, 0])
+    np.multiply.outer(height, unit[:, 1], out=profiles[:, :, 1])
+    return profiles
@@ -0,0 +1,252 @@
+# rasterizer.py
+
+import numpy as np
+from PIL import Image
+
+"""
+Headless software renderer for batch thumbnails and preview animations.
+Triangles are projected orthographically, z-buffered with vectorized
+rasterization and flat Lambert shading. No display or matplotlib figure needed.
+"""
+
+def profiles_to_triangles(oriented_profiles, cap_ends_flag=False):
+    """
+    Builds a triangle array from oriented profiles (same topology as export_mesh_to_obj).
+
+    Parameters:
+      oriented_profiles: List of (K, 3) arrays, or a (P, K, 3) array.
+      cap_ends_flag: If True, add fan triangles capping the first and last profiles.
+
+    Returns:
+      A (F, 3, 3) NumPy array of triangle vertex positions.
+    """
+    profiles = np.asarray(oriented_profiles, dtype=float)
+    if np.allclose(profiles[:, 0], profiles[:, -1]):
+        profiles = profiles[:, :-1]  # drop duplicate closing point
+    a = profiles[:-1]
+    b = np.roll(profiles[:-1], -1, axis=1)
+    c = np.roll(profiles[1:], -1, axis=1)
+    d = profiles[1:]
+    # Two triangles per quad, ordered per segment so profiles[:i+1] maps to the first 2*i*K triangles.
+    quads = np.stack([np.stack([a, b, c], axis=2), np.stack([a, c, d], axis=2)], axis=2)
+    triangles = quads.reshape(-1, 3, 3)
+
+    if cap_ends_flag:
+        caps = []
+        for ring, reverse in ((profiles[0], False), (profiles[-1], True)):
+            center = np.broadcast_to(ring.mean(axis=0), ring.shape)
+            ring_next = np.roll(ring, -1, axis=0)
+            if reverse:
+                ring, ring_next = ring_next, ring
+            caps.append(np.stack([ring, ring_next, center], axis=1))
+        triangles = np.concatenate([triangles] + caps)
+    return triangles
+
+def view_basis(elev=30.0, azim=-60.0):
+    """
+    Returns the (right, up, towards_viewer) unit vectors for a camera at the
+    given elevation and azimuth in degrees (same convention as matplotlib's view_init).
+    """
+    elev, azim = np.radians(elev), np.radians(azim)
+    towards = np.array([np.cos(elev) * np.cos(azim), np.cos(elev) * np.sin(azim), np.sin(elev)])
+    right = np.array([-np.sin(azim), np.cos(azim), 0.0])
+    up = np.cross(towards, right)
+    return right, up, towards
+
+class Rasterizer:
+    """
+    Orthographic z-buffer rasterizer writing into a persistent RGB image.
+
+    Triangles can be drawn incrementally with draw(); the projection is fixed
+    at construction from the given bounds so successive frames line up.
+    """
+
+    def __init__(self, bounds_points, width=256, height=256, elev=30.0, azim=-60.0,
+                 color=(70, 130, 200), background=(255, 255, 255),
+                 light_dir=None, ambient=0.25, shade_levels=240, margin=0.05,
+                 max_fragments=2_000_000):
+        self.width = width
+        self.height = height
+        self.color = np.asarray(color, dtype=float)
+        self.background = np.asarray(background, dtype=np.uint8)
+        self.ambient = ambient
+        self.shade_levels = shade_levels
+        self.max_fragments = max_fragments
+        self.basis = np.stack(view_basis(elev, azim))  # rows: right, up, towards
+
+        if light_dir is None:
+            # Headlight slightly above and to the left of the viewer.
+            right, up, towards = self.basis
+            light_dir = towards + 0.4 * up - 0.3 * right
+        light_dir = np.asarray(light_dir, dtype=float)
+        self.light_dir = light_dir / np.linalg.norm(light_dir)
+
+        # Fit the projected bounds into the image with equal scaling on both axes.
+        projected = np.asarray(bounds_points, dtype=float).reshape(-1, 3) @ self.basis[:2].T
+        lo, hi = projected.min(axis=0), projected.max(axis=0)
+        extent = np.maximum(hi - lo, 1e-12)
+        self.scale = (1.0 - 2 * margin) * min(width / extent[0], height / extent[1])
+        self.center = 0.5 * (lo + hi)
+
+        self.image = np.empty((height, width, 3), dtype=np.uint8)
+        self.image[:] = self.background
+        self.zbuffer = np.full(height * width, np.inf)
+
+    def project(self, points):
+        """Maps 3D points to (pixel x, pixel y, depth); smaller depth is closer to the viewer."""
+        cam = points @ self.basis.T
+        px = (cam[..., 0] - self.center[0]) * self.scale + 0.5 * self.width
+        py = 0.5 * self.height - (cam[..., 1] - self.center[1]) * self.scale
+        return np.stack([px, py, -cam[..., 2]], axis=-1)
+
+    def shade(self, triangles):
+        """
+        Flat two-sided Lambert shading; returns an (F, 3) uint8 array of RGB colors.
+        Intensity is quantized to shade_levels steps so frames fit a GIF palette.
+        """
+        normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+        lengths = np.linalg.norm(normals, axis=1)
+        lengths[lengths == 0] = 1.0
+        lambert = np.abs(normals @ self.light_dir) / lengths
+        lambert = np.round(lambert * (self.shade_levels - 1)) / (self.shade_levels - 1)
+        intensity = self.ambient + (1.0 - self.ambient) * lambert
+        return np.clip(intensity[:, None] * self.color, 0, 255).astype(np.uint8)
+
+    def palette(self, triangles):
+        """Returns the sorted (C, 3) array of all colors draw() can produce for these triangles."""
+        return np.unique(np.vstack([self.shade(triangles), self.background]), axis=0)
+
+    def draw(self, triangles):
+        """Rasterizes an (F, 3, 3) triangle array into the image and z-buffer."""
+        triangles = np.asarray(triangles, dtype=float)
+        if len(triangles) == 0:
+            return self.image
+        screen = self.project(triangles)
+        colors = self.shade(triangles)
+
+        # Barycentric weights and depth as plane equations w = a*x + b*y + c in screen space.
+        x, y, z = screen[:, :, 0], screen[:, :, 1], screen[:, :, 2]
+        x1, y1 = np.roll(x, -1, axis=1), np.roll(y, -1, axis=1)
+        x2, y2 = np.roll(x, -2, axis=1), np.roll(y, -2, axis=1)
+        area = ((x1 - x) * (y2 - y) - (x2 - x) * (y1 - y))[:, 0]
+        valid = np.abs(area) > 1e-12
+        inv_area = np.zeros_like(area)
+        inv_area[valid] = 1.0 / area[valid]
+        wa = (y1 - y2) * inv_area[:, None]
+        wb = (x2 - x1) * inv_area[:, None]
+        wc = (x1 * y2 - x2 * y1) * inv_area[:, None]
+        za, zb, zc = (wa * z).sum(axis=1), (wb * z).sum(axis=1), (wc * z).sum(axis=1)
+
+        # Pixel-center row ranges, clipped to the image.
+        ymin = np.clip(np.ceil(y.min(axis=1) - 0.5), 0, self.height).astype(np.int64)
+        ymax = np.clip(np.floor(y.max(axis=1) - 0.5), -1, self.height - 1).astype(np.int64)
+        nrows = np.where(valid, np.maximum(ymax - ymin + 1, 0), 0)
+
+        # One entry per (triangle, row): intersect the three half-planes w >= 0 to get the x span.
+        tri = np.repeat(np.arange(len(triangles)), nrows)
+        row = ymin[tri] + np.arange(len(tri)) - np.repeat(np.cumsum(nrows) - nrows, nrows)
+        cy = row + 0.5
+        edge = wb[tri] * cy[:, None] + wc[tri]
+        slope = wa[tri]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bound = -edge / slope
+        lo = np.where(slope > 0, bound, -np.inf).max(axis=1)
+        hi = np.where(slope < 0, bound, np.inf).min(axis=1)
+        empty = ((slope == 0) & (edge < 0)).any(axis=1)
+        xlo = np.clip(np.ceil(lo - 0.5), 0, self.width).astype(np.int64)
+        xhi = np.clip(np.floor(hi - 0.5), -1, self.width - 1).astype(np.int64)
+        ncols = np.where(empty, 0, np.maximum(xhi - xlo + 1, 0))
+        zrow = zb[tri] * cy + zc[tri]
+
+        # Expand spans to fragments in chunks so the per-fragment arrays stay bounded.
+        chunk_ids = np.cumsum(ncols) // self.max_fragments
+        for span in np.split(np.arange(len(ncols)), np.nonzero(np.diff(chunk_ids))[0] + 1):
+            n = ncols[span]
+            owner = np.repeat(span, n)
+            if len(owner) == 0:
+                continue
+            px = xlo[owner] + np.arange(len(owner)) - np.repeat(np.cumsum(n) - n, n)
+            depth = za[tri[owner]] * (px + 0.5) + zrow[owner]
+            pixel = row[owner] * self.width + px
+
+            # Depth test: keep fragments that end up as the z-buffer minimum.
+            np.minimum.at(self.zbuffer, pixel, depth)
+            visible = depth == self.zbuffer[pixel]
+            self.image.reshape(-1, 3)[pixel[visible]] = colors[tri[owner[visible]]]
+        return self.image
+
+def _pack_rgb(colors):
+    colors = colors.astype(np.uint32)
+    return (colors[..., 0] << 16) | (colors[..., 1] << 8) | colors[..., 2]
+
+def write_gif(frames, filename, palette, interval=100):
+    """
+    Writes RGB frames as an animated GIF using an exact shared palette,
+    avoiding Pillow's per-frame color quantization.
+
+    Parameters:
+      frames: List of (H, W, 3) uint8 images.
+      filename: Output GIF path.
+      palette: Sorted (C, 3) uint8 array (C <= 256) containing every color in the frames.
+      interval: Time (ms) between frames.
+    """
+    keys = _pack_rgb(palette)
+    flat_palette = palette.ravel().tolist()
+    images = []
+    for frame in frames:
+        image = Image.fromarray(np.searchsorted(keys, _pack_rgb(frame)).astype(np.uint8))
+        image.putpalette(flat_palette)
+        images.append(image)
+    images[0].save(filename, save_all=True, append_images=images[1:], duration=interval, loop=0)
+
+def render_oriented_profiles(oriented_profiles, filename='thumbnail.png', width=256, height=256,
+                             elev=30.0, azim=-60.0, cap_ends_flag=True, **kwargs):
+    """
+    Renders the extruded mesh to an image without any display.
+
+    Parameters:
+      oriented_profiles: List of (K, 3) arrays (e.g. from oriented_profiles_rmf()).
+      filename: Output image path (PNG, JPG, ...); None to skip writing.
+      width, height: Image size in pixels.
+      elev, azim: Camera elevation and azimuth in degrees.
+      cap_ends_flag: Whether to close the first and last profiles.
+      kwargs: Extra Rasterizer options (color, background, light_dir, ambient, shade_levels).
+
+    Returns:
+      The rendered (height, width, 3) uint8 image.
+    """
+    triangles = profiles_to_triangles(oriented_profiles, cap_ends_flag=cap_ends_flag)
+    rasterizer = Rasterizer(triangles, width, height, elev, azim, **kwargs)
+    image = rasterizer.draw(triangles)
+    if filename is not None:
+        Image.fromarray(image).save(filename)
+    return image
+
+def animate_oriented_profiles_headless(oriented_profiles, filename='animation.gif', width=256, height=256,
+                                       elev=30.0, azim=-60.0, interval=100, **kwargs):
+    """
+    Headless counterpart of animate_oriented_profiles(): writes a GIF showing the
+    sequential addition of profiles. Each frame only rasterizes the newly added
+    segment into the persistent z-buffer.
+
+    Parameters:
+      oriented_profiles: List of (K, 3) arrays (e.g. from oriented_profiles_rmf()).
+      filename: Output GIF path; None to skip writing.
+      width, height: Image size in pixels.
+      elev, azim: Camera elevation and azimuth in degrees.
+      interval: Time (ms) between frames.
+      kwargs: Extra Rasterizer options (color, background, light_dir, ambient, shade_levels).
+
+    Returns:
+      A list of (height, width, 3) uint8 frames.
+    """
+    triangles = profiles_to_triangles(oriented_profiles)
+    per_segment = len(triangles) // max(len(oriented_profiles) - 1, 1)
+    rasterizer = Rasterizer(triangles, width, height, elev, azim, **kwargs)
+    frames = [rasterizer.image.copy()]
+    for start in range(0, len(triangles), per_segment):
+        rasterizer.draw(triangles[start:start + per_segment])
+        frames.append(rasterizer.image.copy())
+    if filename is not None:
+        write_gif(frames, filename, rasterizer.palette(triangles), interval)
+    return frames
@@ -60,9 +60,18 @@ def oriented_profiles_rmf(profile, path, frames):
     """
     For each path point with its frame (T, N, B), map the 2D profile into 3D.
     The profile's x-axis aligns with N and y-axis with B.
+
+    profile may be a single (K, 2) profile applied at every path point, or a
+    (P, K, 2) array holding one profile per path point (variable cross-section).
+    All stations are oriented in one batched operation.
     """
-    oriented_profiles = []
-    for pt, (_, N, B) in zip(path, frames):
-        oriented = np.array([pt + x * N + y * B for (x, y) in profile])
-        oriented_profiles.append(oriented)
-    return oriented_profiles
\ No newline at end of file
+    profile = np.asarray(profile, dtype=float)
+    path = np.asarray(path, dtype=float)
+    if profile.ndim == 3 and len(profile) != len(path):
+        raise ValueError(f"Expected {len(path)} profiles (one per path point), got {len(profile)}")
+    N = np.array([N for (_, N, _) in frames])
+    B = np.array([B for (_, _, B) in frames])
+    oriented = (path[:, None, :]
+                + profile[..., 0, None] * N[:, None, :]
+                + profile[..., 1, None] * B[:, None, :])
+    return list(oriented)